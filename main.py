@@ -1,9 +1,16 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import bcrypt
 import io
 import hashlib
+import hmac
 import json
+import os
+import re
+import threading
+import time
 from pathlib import Path
 from utils.style import set_style
 from utils.helpers import map_area
@@ -15,33 +22,70 @@ from utils.helpers import map_area
 # Path to user database
 USER_DB_PATH = Path("user_db.json")
 
+def _ujson_loads(s):
+    """Decode JSON via pandas' bundled ujson (C), falling back to stdlib json."""
+    try:
+        return pd.io.json.ujson_loads(s)
+    except AttributeError:
+        return json.loads(s)
+
+def _ujson_dumps(obj, **kwargs):
+    """Encode JSON via pandas' bundled ujson (C), falling back to stdlib json."""
+    try:
+        return pd.io.json.ujson_dumps(obj, **kwargs)
+    except AttributeError:
+        return json.dumps(obj, **kwargs)
+
+def hash_password(password):
+    """Hash a password with bcrypt (cost factor 12)."""
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode()
+
+def verify_password(password, stored_hash):
+    """Check a password against a stored hash.
+
+    Supports bcrypt hashes ($2...) and legacy unsalted SHA-256 hex digests;
+    both paths compare in constant time.
+    """
+    if stored_hash.startswith("$2"):
+        return bcrypt.checkpw(password.encode(), stored_hash.encode())
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    return hmac.compare_digest(legacy, stored_hash)
+
 def load_users():
     """Load users from JSON file"""
     if USER_DB_PATH.exists():
-        with open(USER_DB_PATH, "r") as f:
-            return json.load(f)
+        return _ujson_loads(USER_DB_PATH.read_text())
     return {
         "admin": {
             "name": "Administrator",
-            "password_hash": hashlib.sha256("admin123".encode()).hexdigest(),
+            "password_hash": hash_password("admin123"),
             "role": "admin"
         }
     }
 
+@st.cache_resource
+def _user_store():
+    """Process-wide user store shared by all sessions.
+
+    The dict is the single source of truth after startup; mutations must hold
+    the lock so concurrent admin sessions can't race each other (or the file).
+    """
+    return {"lock": threading.Lock(), "users": load_users()}
+
 def save_users(users):
-    """Save users to JSON file"""
-    with open(USER_DB_PATH, "w") as f:
-        json.dump(users, f, indent=4)
+    """Save users to JSON file via atomic replace (no partial-file corruption)"""
+    tmp = USER_DB_PATH.with_suffix(".tmp")
+    tmp.write_text(_ujson_dumps(users))
+    os.replace(tmp, USER_DB_PATH)
 
 # Initialize users
-USERS = load_users()
+USERS = _user_store()["users"]
 
 # Initialize session state for authentication
 if 'auth' not in st.session_state:
     st.session_state.auth = {
         'authenticated': False,
         'username': None,
-        'failed_attempts': 0,
         'is_admin': False,
         'show_register': False,
         'user_added': False,
@@ -50,45 +94,72 @@ if 'auth' not in st.session_state:
 
 def register_user(username, name, password, role="user"):
     """Register a new user"""
-    if username in USERS:
-        return False, "Username already exists!"
-    
-    if not username or not password:
-        return False, "Username and password are required!"
-    
-    USERS[username] = {
-        "name": name,
-        "password_hash": hashlib.sha256(password.encode()).hexdigest(),
-        "role": role
-    }
-    save_users(USERS)
+    store = _user_store()
+    with store["lock"]:
+        USERS = store["users"]
+        if username in USERS:
+            return False, "Username already exists!"
+
+        if not username or not password:
+            return False, "Username and password are required!"
+
+        USERS[username] = {
+            "name": name,
+            "password_hash": hash_password(password),
+            "role": role
+        }
+        save_users(USERS)
     st.session_state.auth['user_added'] = True
     return True, f"User {username} registered successfully!"
 
 def remove_user(username):
     """Remove a user from the system"""
-    if username not in USERS:
-        return False, "User does not exist!"
-    
-    if username == "admin":
-        return False, "Cannot delete the admin user!"
-    
-    if username == st.session_state.auth['username']:
-        return False, "Cannot delete your own account while logged in!"
-    
-    del USERS[username]
-    save_users(USERS)
+    store = _user_store()
+    with store["lock"]:
+        USERS = store["users"]
+        if username not in USERS:
+            return False, "User does not exist!"
+
+        if username == "admin":
+            return False, "Cannot delete the admin user!"
+
+        if username == st.session_state.auth['username']:
+            return False, "Cannot delete your own account while logged in!"
+
+        del USERS[username]
+        save_users(USERS)
     st.session_state.auth['user_removed'] = True
     return True, f"User {username} removed successfully!"
 
+# Lockout policy: failures are tracked server-side per username, so closing
+# and reopening the tab does not reset the limit
+LOCKOUT_ATTEMPTS = 5
+LOCKOUT_SECONDS = 300
+
+@st.cache_resource
+def _lockouts():
+    """Per-username failure counts and lockout deadlines, shared across sessions."""
+    return {}
+
 def authenticate(username, password):
     """Authenticate user credentials"""
-    user = USERS.get(username)
-    if user and user['password_hash'] == hashlib.sha256(password.encode()).hexdigest():
+    lockouts = _lockouts()
+    entry = lockouts.get(username)
+    if entry and time.monotonic() < entry["until"]:
+        st.error("Too many failed attempts. Please try again later.")
+        return
+    store = _user_store()
+    user = store["users"].get(username)
+    if user and verify_password(password, user['password_hash']):
+        lockouts.pop(username, None)
+        # Upgrade legacy SHA-256 entries to bcrypt on successful login
+        if not user['password_hash'].startswith("$2"):
+            with store["lock"]:
+                user['password_hash'] = hash_password(password)
+                save_users(store["users"])
         st.session_state.auth = {
             'authenticated': True,
             'username': username,
-            'failed_attempts': 0,
             'is_admin': user.get('role', 'user') == 'admin',
             'show_register': False,
             'user_added': False,
@@ -96,10 +167,11 @@ def authenticate(username, password):
         }
         st.rerun()
     else:
-        st.session_state.auth['failed_attempts'] += 1
-        if st.session_state.auth['failed_attempts'] >= 3:
-            st.error("Too many failed attempts. Please try again later.")
-            st.stop()
+        entry = lockouts.setdefault(username, {"fails": 0, "until": 0.0})
+        entry["fails"] += 1
+        if entry["fails"] >= LOCKOUT_ATTEMPTS:
+            entry["until"] = time.monotonic() + LOCKOUT_SECONDS
+            entry["fails"] = 0
         st.error("Invalid username or password")
 
 def logout():
@@ -107,7 +179,6 @@ def logout():
     st.session_state.auth = {
         'authenticated': False,
         'username': None,
-        'failed_attempts': 0,
         'is_admin': False,
         'show_register': False,
         'user_added': False,
@@ -244,43 +315,104 @@ if st.session_state.auth['is_admin']:
 # ============================================
 # MAIN DASHBOARD FUNCTIONALITY
 # ============================================
+@st.cache_data(show_spinner=False)
+def load_as_arrow(file_bytes: bytes) -> bytes:
+    """Parse the uploaded workbook once and cache it as zstd-compressed
+    Parquet bytes; reruns rehydrate through pyarrow's columnar reader
+    instead of re-parsing XLSX or unpickling a full DataFrame."""
+    frame = pd.read_excel(io.BytesIO(file_bytes), sheet_name="Sheet1", engine="openpyxl")
+    buf = io.BytesIO()
+    frame.to_parquet(buf, engine="pyarrow", compression="zstd")
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def build_area_lookup(unique_areas: tuple) -> dict:
+    """Classify each distinct responsibility area once; rows map via dict lookup."""
+    return {a: map_area(a) for a in unique_areas}
+
+def dept_options(dept_col: pd.Series) -> list:
+    """Department widget options; category dtype yields them from the int
+    codes instead of a full string-unique scan of the column."""
+    if isinstance(dept_col.dtype, pd.CategoricalDtype):
+        return dept_col.cat.remove_unused_categories().cat.categories.tolist()
+    return sorted(dept_col.dropna().unique().tolist())
+
+@st.cache_data(show_spinner=False)
+def describe_all(frame: pd.DataFrame) -> pd.DataFrame:
+    """Summary statistics over all columns, cached on the frame contents
+    (describe does O(n) unique-counting per object column)."""
+    return frame.describe(include='all')
+
+@st.cache_data(show_spinner=False)
+def to_xlsx(table: pd.DataFrame, sheet: str) -> bytes:
+    """Serialize a summary table to xlsx bytes, cached on the table contents."""
+    buf = io.BytesIO()
+    with pd.ExcelWriter(buf, engine='xlsxwriter') as writer:
+        table.to_excel(writer, index=False, sheet_name=sheet)
+    return buf.getvalue()
+
 uploaded_file = st.file_uploader("Upload Permit Excel File", type=["xlsx"])
 
 if uploaded_file:
     # DATA LOADING AND PREPROCESSING
-    df_raw = pd.read_excel(uploaded_file, sheet_name="Sheet1")
+    df_raw = pd.read_parquet(io.BytesIO(load_as_arrow(uploaded_file.getvalue())), engine="pyarrow")
+
+    # Repeatedly filtered/grouped string columns become category dtype so
+    # groupby/value_counts/isin compare int codes instead of Python strings.
+    # Workflow State is stripped/uppercased here as well, so the Closed and
+    # Status checks below are plain code compares with no per-rerun .str work
+    df_raw["Workflow State"] = df_raw["Workflow State"].str.strip().str.upper().astype("category")
+    for col in ["Department", "Responsibility Areas"]:
+        df_raw[col] = df_raw[col].astype("category")
 
     # Add 'Closed' column based on Workflow State
-    df_raw["Closed"] = df_raw["Workflow State"].str.upper() == "CLOSED"
+    df_raw["Closed"] = df_raw["Workflow State"] == "CLOSED"
+
+    # Status classification, computed once so date-filtered slices inherit it
+    ws = df_raw["Workflow State"]
+    df_raw["Status"] = np.where(
+        ws == "PENDING CLOSURE", "PENDING CLOSURE",
+        np.where(ws == "EXPIRED", "EXPIRED", None)
+    )
+
+    # Area and uppercased Department, also computed once up front
+    area_lookup = build_area_lookup(tuple(df_raw["Responsibility Areas"].dropna().unique()))
+    # fillna keeps map_area's fallback bucket for rows with no responsibility area
+    df_raw["Area"] = df_raw["Responsibility Areas"].map(area_lookup).fillna("OTHERS").astype("category")
+    df_raw["Department"] = df_raw["Department"].str.upper().astype("category")
 
     # DATE FILTERING
     if "Created Date" in df_raw.columns:
         df_raw["Created Date"] = pd.to_datetime(df_raw["Created Date"], errors='coerce')
+        # Sort by Created Date so range filters become binary-search slices
+        # instead of full-column boolean masks (NaT rows sort last, outside
+        # any selected range, matching the old mask behaviour)
+        df_raw = df_raw.sort_values("Created Date").reset_index(drop=True)
+        created = df_raw["Created Date"].to_numpy()
         global_min_date = df_raw["Created Date"].min()
         global_max_date = df_raw["Created Date"].max()
 
         global_start_date, global_end_date = st.date_input(
-            "🕵️ Select Global Date Range (applies to entire dashboard):", 
-            [global_min_date, global_max_date], 
+            "🕵️ Select Global Date Range (applies to entire dashboard):",
+            [global_min_date, global_max_date],
             key="global_date"
         )
 
-        df = df_raw[
-            (df_raw["Created Date"] >= pd.to_datetime(global_start_date)) & 
-            (df_raw["Created Date"] <= pd.to_datetime(global_end_date))
-        ].copy()
+        lo = created.searchsorted(pd.to_datetime(global_start_date).to_datetime64(), side="left")
+        hi = created.searchsorted(pd.to_datetime(global_end_date).to_datetime64(), side="right")
+        df = df_raw.iloc[lo:hi].copy()
 
         st.markdown("### 🕵️ Date Filter for All Tables and Charts")
         st.caption("Filter results by Created Date for all permit analysis below.")
         date_filter = st.date_input(
-            "Select Date Range for Result Filtering:", 
-            [df["Created Date"].min(), df["Created Date"].max()], 
+            "Select Date Range for Result Filtering:",
+            [df["Created Date"].min(), df["Created Date"].max()],
             key="results_filter"
         )
-        filtered_df = df[
-             (df["Created Date"] >= pd.to_datetime(date_filter[0])) & 
-            (df["Created Date"] <= pd.to_datetime(date_filter[1]))
-        ].copy()
+        created = df["Created Date"].to_numpy()
+        lo = created.searchsorted(pd.to_datetime(date_filter[0]).to_datetime64(), side="left")
+        hi = created.searchsorted(pd.to_datetime(date_filter[1]).to_datetime64(), side="right")
+        filtered_df = df.iloc[lo:hi].copy()
     else:
         st.warning("❗ 'Created Date' column not found in uploaded file. Date-based filtering has been skipped.")
         df = df_raw.copy()
@@ -291,13 +423,16 @@ if uploaded_file:
     st.dataframe(df.head(), use_container_width=True)
 
     with st.expander("📌 Summary Statistics"):
-        st.write(df.describe(include='all'))
+        # Expander children still execute on every rerun, so only compute on demand
+        if st.checkbox("Compute summary statistics"):
+            st.write(describe_all(df))
 
     # DEPARTMENT FILTER
     st.subheader("🔍 Filter Options")
+    unique_depts = dept_options(df["Department"])
     departments = st.multiselect(
-        "Select Department(s):", 
-        df["Department"].dropna().unique()
+        "Select Department(s):",
+        unique_depts
     )
 
     if departments:
@@ -305,8 +440,13 @@ if uploaded_file:
 
     # VISUALIZATIONS
     st.subheader("📈 Permit Counts by Department")
-    dept_chart = filtered_df["Department"].value_counts().reset_index()
-    dept_chart.columns = ["Department", "Permit Count"]
+    dept_chart = (
+        filtered_df.groupby("Department", observed=True, sort=False)
+        .size()
+        .sort_values(ascending=False)
+        .rename("Permit Count")
+        .reset_index()
+    )
 
     fig1 = px.bar(
         dept_chart,
@@ -330,7 +470,6 @@ if uploaded_file:
 
     # WORKFLOW STATE ANALYSIS
     st.subheader("📈 Workflow State Distribution")
-    unique_depts = df["Department"].dropna().unique().tolist()
     selected_dept = st.selectbox(
         "Select Department for Workflow State Breakdown (optional):", 
         ["All"] + unique_depts
@@ -338,9 +477,14 @@ if uploaded_file:
 
     wf_df = filtered_df if selected_dept == "All" else filtered_df[filtered_df["Department"] == selected_dept]
 
-    state_chart = wf_df["Workflow State"].value_counts().reset_index()
-    state_chart.columns = ["Workflow State", "Count"]
-    state_chart["Workflow State"] = state_chart["Workflow State"] + " (" + state_chart["Count"].astype(str) + ")"
+    state_chart = (
+        wf_df.groupby("Workflow State", observed=True, sort=False)
+        .size()
+        .sort_values(ascending=False)
+        .rename("Count")
+        .reset_index()
+    )
+    state_chart["Workflow State"] = state_chart["Workflow State"].astype(str) + " (" + state_chart["Count"].astype(str) + ")"
 
     fig2 = px.pie(
         state_chart,
@@ -359,56 +503,43 @@ if uploaded_file:
     # AREA MAPPING AND SUMMARY TABLES
     dept_cols = ["CES ELECTRICAL", "CIVIL", "FIRE", "HSEF", "INSTRUMENTATION", "MECHANICAL", "PROCESS"]
 
-    df["Area"] = df["Responsibility Areas"].apply(map_area)
-    filtered_df["Area"] = filtered_df["Responsibility Areas"].apply(map_area)
-    df["Department"] = df["Department"].str.upper()
-    filtered_df["Department"] = filtered_df["Department"].str.upper()
-
     # CUSTOM SUMMARY TABLE
     st.subheader("📄 Customized Permit Summary Table")
 
-    # Status classification
-    df["Status"] = df["Workflow State"].apply(
-        lambda x: "PENDING CLOSURE" if str(x).strip().upper() == "PENDING CLOSURE" 
-        else ("EXPIRED" if str(x).strip().upper() == "EXPIRED" else None)
-    )
-    filtered_df["Status"] = filtered_df["Workflow State"].apply(
-        lambda x: "PENDING CLOSURE" if str(x).strip().upper() == "PENDING CLOSURE" 
-        else ("EXPIRED" if str(x).strip().upper() == "EXPIRED" else None)
-    )
+    # Closed counts per area (the Closed column is inherited from df_raw)
+    closed_counts = filtered_df.groupby("Area", observed=True)["Closed"].sum().astype(int)
+
+    # Create count tables in one crosstab pass each; unused area categories
+    # are trimmed so crosstab doesn't emit all-zero rows
+    area = filtered_df["Area"].cat.remove_unused_categories()
+    pivot = pd.crosstab(area, filtered_df["Department"]).reindex(columns=dept_cols, fill_value=0)
 
-    # Count Closed as new column
-    filtered_df["Closed"] = filtered_df["Workflow State"].str.upper() == "CLOSED"
-    closed_counts = filtered_df.groupby("Area")["Closed"].sum().astype(int)
-
-    # Create pivot tables
-    pivot = pd.pivot_table(
-        filtered_df,
-        index="Area",
-        columns="Department",
-        values="Permit Number",
-        aggfunc="count",
-        fill_value=0
-    ).reindex(columns=dept_cols, fill_value=0)
-
-    status_counts = filtered_df[filtered_df["Status"].notna()].groupby(["Area", "Status"]).size().unstack(fill_value=0)
-
-    # Final table construction
-    final_table = pivot.join(status_counts, how="outer").fillna(0).astype(int)
-    final_table = final_table.join(closed_counts, how="left")
-    final_table.rename(columns={"Closed": "CLOSED"}, inplace=True)
+    has_status = filtered_df["Status"].notna()
+    status_counts = pd.crosstab(area[has_status], filtered_df.loc[has_status, "Status"])
+
+    # Final table construction: one aligned concat instead of two joins
+    final_table = (
+        pd.concat([pivot, status_counts, closed_counts.rename("CLOSED")], axis=1)
+        .fillna(0)
+        .astype(np.int32)
+        .rename_axis("Area")
+    )
     final_table.reset_index(inplace=True)
 
+    all_columns = dept_cols + ["EXPIRED", "PENDING CLOSURE", "CLOSED"]
     for col in ["EXPIRED", "PENDING CLOSURE", "CLOSED"]:
         if col not in final_table.columns:
             final_table[col] = 0
 
-    total_row = final_table[dept_cols + ["EXPIRED", "PENDING CLOSURE", "CLOSED"]].sum().to_frame().T
-    total_row.insert(0, "Area", "TOTAL")
-    final_table = pd.concat([final_table, total_row], ignore_index=True)
+    # Append the total row in place; concat would copy the whole frame and
+    # promote the count columns to float. Area must be plain str first, as a
+    # categorical column would reject the new TOTAL label
+    final_table["Area"] = final_table["Area"].astype(str)
+    totals = final_table[all_columns].sum()
+    totals["Area"] = "TOTAL"
+    final_table.loc[len(final_table)] = totals
 
     final_table.rename(columns={"Area": "RESPONSIBILITY AREAS"}, inplace=True)
-    all_columns = dept_cols + ["EXPIRED", "PENDING CLOSURE", "CLOSED"]
     selected_columns = st.multiselect(
         "Select Columns to Display (apart from Responsibility Areas):", 
         all_columns, 
@@ -419,14 +550,9 @@ if uploaded_file:
     st.dataframe(display_table, use_container_width=True)
 
     # Download button for custom summary
-    output = io.BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        display_table.to_excel(writer, index=False, sheet_name='Custom Summary')
-    output.seek(0)
-
     st.download_button(
         label="🕵 Download Custom Summary",
-        data=output,
+        data=to_xlsx(display_table, 'Custom Summary'),
         file_name="Custom_Permit_Summary.xlsx",
         mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     )
@@ -438,50 +564,48 @@ if uploaded_file:
     plant_options = ["CPP", "HDPE", "HSEF", "IOP ECR", "IOP NCR", "IOP SCR", "LLDPE", "NCAU", "NCU", "IOP BAGGING", "OTHERS", "PP"]
     selected_plant = st.selectbox("Select a Plant:", plant_options)
 
+    # Precompiled patterns: one vectorized pass per plant instead of chained
+    # startswith/contains scans over the column
+    PLANT_PATTERNS = {
+        # CPP includes all Power Plant areas
+        "CPP": re.compile(r"^(CPP|Power Plant)"),
+        # NCU includes CCR areas and CCR(Safety District-2)
+        "NCU": re.compile(r"^(NCU|CCR)|CCR\(Safety District-2\)"),
+        "PP": re.compile(r"^PP"),
+    }
+    PLANT_AREA_LABELS = {
+        "CPP": "CPP (Including Power Plant Areas)",
+        "NCU": "NCU (Including CCR Areas)",
+        "PP": "PP",
+    }
+
     # Updated plant filtering logic
-    if selected_plant == "CPP":
-        # Include CPP and all Power Plant areas
-        plant_df = filtered_df[
-            (filtered_df["Responsibility Areas"].str.startswith("CPP", na=False)) |
-            (filtered_df["Responsibility Areas"].str.startswith("Power Plant", na=False))
-        ].copy()
-        plant_df["Area"] = "CPP (Including Power Plant Areas)"
-    elif selected_plant == "NCU":
-        # Include NCU, CCR, and CCR(Safety District-2)
+    if selected_plant in PLANT_PATTERNS:
         plant_df = filtered_df[
-            (filtered_df["Responsibility Areas"].str.startswith("NCU", na=False)) |
-            (filtered_df["Responsibility Areas"].str.startswith("CCR", na=False)) |
-            (filtered_df["Responsibility Areas"].str.contains("CCR(Safety District-2)", na=False))
+            filtered_df["Responsibility Areas"].str.contains(PLANT_PATTERNS[selected_plant], na=False)
         ].copy()
-        plant_df["Area"] = "NCU (Including CCR Areas)"
-    elif selected_plant == "PP":
-        # PP specific logic remains the same
-        plant_df = filtered_df[filtered_df["Responsibility Areas"].str.startswith("PP", na=False)].copy()
-        plant_df["Area"] = "PP"
+        plant_df["Area"] = PLANT_AREA_LABELS[selected_plant]
     else:
         # Default logic for other plants
-        plant_df = filtered_df[filtered_df["Responsibility Areas"].str.contains(selected_plant, case=False, na=False)]
+        # Plant names are literal strings; regex=False uses the C substring matcher
+        plant_df = filtered_df[filtered_df["Responsibility Areas"].str.contains(selected_plant, case=False, na=False, regex=False)]
 
     if plant_df.empty:
         st.warning("No data found for selected plant")
     else:
-        plantwise_summary = plant_df.groupby(["Area", "Department"]).size().reset_index(name="Permit Count")
+        plantwise_summary = plant_df.groupby(["Area", "Department"], observed=True).size().reset_index(name="Permit Count")
         plantwise_summary.rename(columns={"Area": "RESPONSIBILITY AREA", "Department": "DEPARTMENT"}, inplace=True)
         total_count = plantwise_summary["Permit Count"].sum()
-        total_row = pd.DataFrame([["TOTAL", "", total_count]], 
-                               columns=["RESPONSIBILITY AREA", "DEPARTMENT", "Permit Count"])
-        plantwise_summary = pd.concat([plantwise_summary, total_row], ignore_index=True)
+        # Key columns may be categorical from the groupby; cast so the in-place
+        # TOTAL row assignment is accepted
+        plantwise_summary = plantwise_summary.astype({"RESPONSIBILITY AREA": str, "DEPARTMENT": str})
+        plantwise_summary.loc[len(plantwise_summary)] = ["TOTAL", "", total_count]
         st.dataframe(plantwise_summary, use_container_width=True)
 
         # Download button for plantwise summary
-        output_plant = io.BytesIO()
-        with pd.ExcelWriter(output_plant, engine='xlsxwriter') as writer:
-            plantwise_summary.to_excel(writer, index=False, sheet_name='Plantwise Summary')
-        output_plant.seek(0)
-
         st.download_button(
             label="🕵 Download Plantwise Summary",
-            data=output_plant,
+            data=to_xlsx(plantwise_summary, 'Plantwise Summary'),
             file_name="Plantwise_Summary.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         )